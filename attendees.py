@@ -0,0 +1,143 @@
+from flask import Blueprint, request, jsonify, abort
+from sqlalchemy import func, insert, select, tuple_, update
+
+from cache import cache, event_cache_key
+from database import db, transaction
+from models import Attendee, VALID_CLASSIFICATIONS
+from query_utils import event_exists, keyset_response, parse_keyset, rows_to_dicts
+
+attendees_bp = Blueprint("attendees", __name__)
+
+# Tope por petición: coincide con la página de insertmanyvalues (un solo INSERT)
+MAX_BULK_SIZE = 1000
+
+# Validación O(1) y respuesta de error construida una sola vez
+_VALID_CLASSIFICATIONS = frozenset(VALID_CLASSIFICATIONS)
+_INVALID_CLASSIFICATION = (
+    {"error": f"classification must be one of {list(VALID_CLASSIFICATIONS)}"},
+    400
+)
+
+
+def _is_valid_classification(value):
+    # frozenset exige valores hashables: listas/objetos JSON se rechazan antes
+    return isinstance(value, str) and value in _VALID_CLASSIFICATIONS
+
+
+# ✅ Crear asistente
+@attendees_bp.route("/events/<int:event_id>/attendees", methods=["POST"])
+def add_attendee(event_id):
+    data = request.get_json(silent=True, cache=False)
+    if not isinstance(data, dict):
+        return {"error": "json body required"}, 400
+    name = data.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return {"error": "name required"}, 400
+    if not _is_valid_classification(data.get("classification")):
+        return _INVALID_CLASSIFICATION
+
+    with transaction():
+        if not event_exists(event_id):
+            abort(404)
+
+        attendee = Attendee(
+            event_id=event_id,
+            name=name,
+            classification=data["classification"]
+        )
+
+        db.session.add(attendee)
+        db.session.flush()
+        result = attendee.to_dict()
+    cache.delete(event_cache_key(event_id))
+
+    return result, 201
+
+
+# ✅ Crear asistentes en lote (un solo INSERT multi-VALUES)
+@attendees_bp.route("/events/<int:event_id>/attendees/bulk", methods=["POST"])
+def add_attendees_bulk(event_id):
+    data = request.get_json(silent=True, cache=False)
+    if not isinstance(data, list) or not data:
+        return {"error": "list of attendees required"}, 400
+    if len(data) > MAX_BULK_SIZE:
+        return {"error": f"at most {MAX_BULK_SIZE} attendees per request"}, 400
+    for i, item in enumerate(data):
+        if not isinstance(item, dict):
+            return {"error": f"attendee {i} must be an object"}, 400
+        name = item.get("name")
+        if not isinstance(name, str) or not name.strip():
+            return {"error": f"attendee {i}: name required"}, 400
+    if not all(_is_valid_classification(item.get("classification")) for item in data):
+        return _INVALID_CLASSIFICATION
+
+    rows = [
+        {
+            "event_id": event_id,
+            "name": item["name"],
+            "classification": item["classification"]
+        }
+        for item in data
+    ]
+    with transaction():
+        if not event_exists(event_id):
+            abort(404)
+        # sort_by_parameter_order: las filas devueltas siguen el orden de la
+        # entrada (un solo INSERT en Postgres; SQLite degrada a uno por fila)
+        attendees = db.session.scalars(
+            insert(Attendee).returning(Attendee, sort_by_parameter_order=True),
+            rows
+        ).all()
+        # Serializar antes del commit para no recargar cada fila expirada
+        result = [a.to_dict() for a in attendees]
+    cache.delete(event_cache_key(event_id))
+
+    return jsonify(result), 201
+
+
+# ✅ Listar asistentes
+@attendees_bp.route("/events/<int:event_id>/attendees", methods=["GET"])
+def list_attendees(event_id):
+    try:
+        cursor, limit = parse_keyset("after")
+    except ValueError:
+        return {"error": "invalid after/after_id/limit"}, 400
+
+    if not event_exists(event_id):
+        abort(404)
+
+    stmt = select(
+        Attendee.id,
+        Attendee.event_id,
+        Attendee.name,
+        Attendee.classification,
+        Attendee.checked_in,
+        Attendee.created_at
+    ).where(
+        Attendee.event_id == event_id
+    ).order_by(Attendee.created_at, Attendee.id)
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Attendee.created_at, Attendee.id) > cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return keyset_response(rows_to_dicts(db.session.execute(stmt)), "after", limit)
+
+
+# ✅ Marcar entrada
+@attendees_bp.route("/attendees/<int:attendee_id>/checkin", methods=["PATCH"])
+def toggle_checkin(attendee_id):
+    # Un solo UPDATE ... RETURNING: atómico y sin SELECT previo
+    stmt = (
+        update(Attendee)
+        .where(Attendee.id == attendee_id)
+        # NOT NULL sigue siendo NULL: un checked_in nulo cuenta como False
+        .values(checked_in=~func.coalesce(Attendee.checked_in, False))
+        .returning(Attendee)
+    )
+    with transaction():
+        attendee = db.session.scalars(stmt).one_or_none()
+        if attendee is None:
+            abort(404)
+        result = attendee.to_dict()
+
+    return result
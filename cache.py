@@ -0,0 +1,6 @@
+from flask_caching import Cache
+cache = Cache()
+
+
+def event_cache_key(event_id):
+    return f"event:{event_id}"
@@ -5,6 +5,24 @@ class Config:
     DEBUG = False
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")  # RDS
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Crear tablas al iniciar la app (solo desarrollo; en producción usar init_db.py)
+    AUTO_CREATE_TABLES = os.getenv("AUTO_CREATE_TABLES", "false").lower() == "true"
+
+    # Pool de conexiones por proceso (dimensionado con Gunicorn: ver gunicorn.conf.py)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("SQLALCHEMY_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", 5)),
+        "pool_timeout": int(os.getenv("SQLALCHEMY_POOL_TIMEOUT", 5)),
+        "pool_recycle": int(os.getenv("SQLALCHEMY_POOL_RECYCLE", 3600)),
+        "pool_pre_ping": True,
+    }
+
+    # Caché de respuestas compartida entre workers: RedisCache si hay CACHE_REDIS_URL,
+    # si no NullCache (una caché por proceso serviría datos viejos en los demás workers)
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+    CACHE_TYPE = os.getenv("CACHE_TYPE") or ("RedisCache" if CACHE_REDIS_URL else "NullCache")
+    CACHE_NO_NULL_WARNING = True
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 60))
 
     # AWS S3
     AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY")
@@ -1,2 +1,16 @@
+from contextlib import contextmanager
 from flask_sqlalchemy import SQLAlchemy
 db = SQLAlchemy()
+
+
+@contextmanager
+def transaction():
+    # Un solo commit por petición; rollback si algo falla (incluido abort).
+    # A diferencia de session.begin(), funciona aunque la sesión ya haya
+    # iniciado una transacción con una lectura previa en el mismo contexto.
+    try:
+        yield db.session
+        db.session.commit()
+    except BaseException:
+        db.session.rollback()
+        raise
@@ -0,0 +1,114 @@
+import hashlib
+from flask import Blueprint, request, jsonify
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import raiseload
+
+from cache import cache, event_cache_key
+from database import db, transaction
+from models import Event
+from query_utils import keyset_response, parse_keyset, rows_to_dicts
+from s3_utils import upload_file_to_s3, generate_presigned_upload, public_url, EXT_BY_MIME
+
+events_bp = Blueprint("events", __name__)
+
+
+# ✅ URL firmada para subir la imagen directo a S3
+@events_bp.route("/events/image-upload-url", methods=["POST"])
+def create_image_upload_url():
+    data = request.get_json(silent=True, cache=False) or {}
+    if not isinstance(data, dict):
+        return {"error": "json object required"}, 400
+    content_type = data.get("content_type")
+
+    if not content_type or not isinstance(content_type, str):
+        return {"error": "content_type required"}, 400
+    if content_type not in EXT_BY_MIME:
+        return {"error": f"content_type must be one of {list(EXT_BY_MIME)}"}, 415
+
+    return generate_presigned_upload(content_type), 201
+
+
+# ✅ Crear evento
+@events_bp.route("/events", methods=["POST"])
+def create_event():
+    # multipart (imagen incluida) o JSON con image_url ya subida a S3
+    data = request.form or request.get_json(silent=True, cache=False) or {}
+    if not isinstance(data, dict):
+        return {"error": "json object required"}, 400
+    title = data.get("title")
+    description = data.get("description")
+
+    if not title or not isinstance(title, str):
+        return {"error": "title required"}, 400
+    if description is not None and not isinstance(description, str):
+        return {"error": "description must be a string"}, 400
+
+    image_url = data.get("image_url")
+    if image_url is not None and (
+        not isinstance(image_url, str) or not image_url.startswith(public_url("events/"))
+    ):
+        return {"error": "invalid image_url"}, 400
+
+    if "image" in request.files:
+        image = request.files["image"]
+        if image.mimetype not in EXT_BY_MIME:
+            return {"error": f"image must be one of {list(EXT_BY_MIME)}"}, 415
+        image_url = upload_file_to_s3(image)
+
+    with transaction():
+        event = Event(title=title, description=description, image_url=image_url)
+        db.session.add(event)
+        db.session.flush()
+        result = event.to_dict()
+
+    return result, 201
+
+
+# ✅ Listar eventos
+@events_bp.route("/events", methods=["GET"])
+def list_events():
+    try:
+        cursor, limit = parse_keyset("before")
+    except ValueError:
+        return {"error": "invalid before/before_id/limit"}, 400
+
+    # Solo lectura: filas Core, sin instanciar objetos ORM
+    stmt = select(
+        Event.id,
+        Event.title,
+        Event.description,
+        Event.image_url,
+        Event.created_at,
+        Event.attendees_count
+    ).order_by(Event.created_at.desc(), Event.id.desc())
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Event.created_at, Event.id) < cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return keyset_response(rows_to_dicts(db.session.execute(stmt)), "before", limit)
+
+
+# ✅ Obtener evento por ID
+@events_bp.route("/events/<int:event_id>", methods=["GET"])
+def get_event(event_id):
+    key = event_cache_key(event_id)
+    data = cache.get(key)
+    if data is None:
+        event = Event.query.options(raiseload("*")).get_or_404(event_id)
+        data = event.to_dict()
+        cache.set(key, data)
+
+    # ETag: el cliente recibe 304 si el evento no cambió
+    response = jsonify(data)
+    response.set_etag(hashlib.blake2s(response.get_data()).hexdigest())
+    return response.make_conditional(request)
+
+
+# ✅ Eliminar evento
+@events_bp.route("/events/<int:event_id>", methods=["DELETE"])
+def delete_event(event_id):
+    with transaction():
+        event = Event.query.get_or_404(event_id)
+        db.session.delete(event)
+    cache.delete(event_cache_key(event_id))
+    return {"message": "deleted"}
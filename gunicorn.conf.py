@@ -0,0 +1,29 @@
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config import Config
+
+# ✅ Workers gevent: cada proceso atiende muchas peticiones mientras espera RDS/S3
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+
+# Concurrencia y pool de SQLAlchemy (config.py) se dimensionan juntos:
+# - cada worker abre hasta pool_size + max_overflow conexiones (5 + 5 por defecto)
+#   y acepta, por defecto, ese mismo número de peticiones simultáneas;
+# - workers * (pool_size + max_overflow) debe quedar <= max_connections de RDS;
+# - si GUNICORN_WORKER_CONNECTIONS supera el pool, las peticiones sobrantes esperan
+#   conexión como mucho SQLALCHEMY_POOL_TIMEOUT segundos (5) y fallan rápido.
+_engine_options = Config.SQLALCHEMY_ENGINE_OPTIONS
+_db_connections = _engine_options["pool_size"] + _engine_options["max_overflow"]
+
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", _db_connections))
+
+
+def post_fork(server, worker):
+    # psycopg2 es una extensión C: hay que hacerla cooperativa con gevent
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
@@ -1,8 +1,15 @@
 from database import db
 from datetime import datetime
+from sqlalchemy import func, select
+
+VALID_CLASSIFICATIONS = ("Sponsor", "VIP", "Platino", "General")
 
 class Event(db.Model):
     __tablename__ = "events"
+    __table_args__ = (
+        # Orden y paginación keyset de list_events
+        db.Index("ix_events_created_id", "created_at", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -10,7 +17,9 @@ class Event(db.Model):
     image_url = db.Column(db.String(500))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    attendees = db.relationship("Attendee", backref="event", cascade="all, delete-orphan")
+    attendees = db.relationship(
+        "Attendee", back_populates="event", cascade="all, delete-orphan", lazy="select"
+    )
 
     def to_dict(self):
         return {
@@ -18,21 +27,31 @@ class Event(db.Model):
             "title": self.title,
             "description": self.description,
             "image_url": self.image_url,
-            "created_at": self.created_at.isoformat(),
-            "attendees_count": len(self.attendees)
+            "created_at": self.created_at,
+            "attendees_count": self.attendees_count
         }
 
 
 class Attendee(db.Model):
     __tablename__ = "attendees"
+    __table_args__ = (
+        # Cubre el filtro/paginación de list_attendees y el conteo por evento
+        db.Index("ix_attendees_event_created", "event_id", "created_at", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=False)
     name = db.Column(db.String(200), nullable=False)
-    classification = db.Column(db.String(50))
+    classification = db.Column(
+        db.Enum(*VALID_CLASSIFICATIONS, name="classification_enum"),
+        nullable=False,
+        default="General"
+    )
     checked_in = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    event = db.relationship("Event", back_populates="attendees")
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -40,5 +59,14 @@ class Attendee(db.Model):
             "name": self.name,
             "classification": self.classification,
             "checked_in": self.checked_in,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
         }
+
+
+# Conteo de asistentes calculado en el mismo SELECT del evento (evita N+1)
+Event.attendees_count = db.column_property(
+    select(func.count(Attendee.id))
+    .where(Attendee.event_id == Event.id)
+    .correlate_except(Attendee)
+    .scalar_subquery()
+)
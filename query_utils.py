@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from flask import jsonify, request, url_for
+from sqlalchemy import select
+
+from database import db
+from models import Event
+
+MAX_PAGE_SIZE = 500
+
+
+def parse_keyset(name):
+    """Lee ?<name>=<iso>&<name>_id=<int>&limit=N para paginación keyset.
+
+    Devuelve ((created_at, id) o None, limit); sin ?limit el límite es None
+    y se devuelve la lista completa. Lanza ValueError si el cursor o el límite
+    están incompletos o mal formados.
+    """
+    limit = request.args.get("limit")
+    if limit is not None:
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        limit = min(limit, MAX_PAGE_SIZE)
+
+    raw = request.args.get(name)
+    last_id = request.args.get(f"{name}_id", type=int)
+    if raw is None:
+        return None, limit
+    if last_id is None:
+        raise ValueError(f"{name} and {name}_id required together")
+
+    # Las fechas salen en UTC con sufijo "Z"; en BD se guardan naive (utcnow)
+    created_at = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return (created_at, last_id), limit
+
+
+def keyset_response(rows, name, limit):
+    """Responde la página y, si quedó llena, un Link rel="next" con el cursor."""
+    response = jsonify(rows)
+    if limit is not None and len(rows) == limit and rows[-1]["created_at"] is not None:
+        last = rows[-1]
+        args = {
+            **request.args.to_dict(),
+            name: last["created_at"].isoformat(),
+            f"{name}_id": last["id"],
+            "limit": limit
+        }
+        url = url_for(request.endpoint, **request.view_args, **args, _external=True)
+        response.headers["Link"] = f'<{url}>; rel="next"'
+    return response
+
+
+def event_exists(event_id):
+    # Solo verifica existencia: SELECT 1, sin traer ni hidratar la fila
+    return db.session.execute(select(1).where(Event.id == event_id)).scalar() is not None
+
+
+def rows_to_dicts(result):
+    # Claves resueltas una vez por consulta; cada fila solo se combina con ellas
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
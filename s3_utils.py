@@ -1,26 +1,76 @@
 import boto3
 import uuid
+from functools import lru_cache
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from config import Config
 
-def upload_file_to_s3(file):
-    s3 = boto3.client(
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
+PRESIGNED_EXPIRES_IN = 300  # segundos
+
+# Tipos de imagen aceptados; la extensión nunca se toma del nombre del archivo
+EXT_BY_MIME = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp"
+}
+
+# Imágenes de evento (<= 5 MB) en un solo PUT, sin pool de hilos
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    use_threads=False,
+    io_chunksize=256 * 1024
+)
+
+
+@lru_cache(maxsize=None)
+def get_s3_client():
+    # Cliente único por proceso: reutiliza el pool de conexiones de botocore
+    return boto3.client(
         "s3",
         aws_access_key_id=Config.AWS_ACCESS_KEY,
         aws_secret_access_key=Config.AWS_SECRET_KEY,
-        region_name=Config.AWS_REGION
+        region_name=Config.AWS_REGION,
+        config=BotoConfig(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"}
+        )
     )
 
-    ext = file.filename.split(".")[-1]
-    key = f"events/{uuid.uuid4()}.{ext}"
+
+def public_url(key):
+    return f"https://{Config.AWS_BUCKET_NAME}.s3.{Config.AWS_REGION}.amazonaws.com/{key}"
+
+
+def generate_presigned_upload(content_type):
+    # El cliente sube la imagen directo a S3; Flask solo firma la petición
+    key = f"events/{uuid.uuid4()}.{EXT_BY_MIME[content_type]}"
+
+    post = get_s3_client().generate_presigned_post(
+        Bucket=Config.AWS_BUCKET_NAME,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 0, MAX_UPLOAD_SIZE]
+        ],
+        ExpiresIn=PRESIGNED_EXPIRES_IN
+    )
+
+    return {"url": post["url"], "fields": post["fields"], "image_url": public_url(key)}
+
+
+def upload_file_to_s3(file):
+    s3 = get_s3_client()
+
+    key = f"events/{uuid.uuid4()}.{EXT_BY_MIME[file.mimetype]}"
 
     s3.upload_fileobj(
         file,
         Config.AWS_BUCKET_NAME,
         key,
-        ExtraArgs={
-            "ContentType": file.content_type,
-            "ACL": "public-read"
-        }
+        ExtraArgs={"ContentType": file.mimetype},
+        Config=TRANSFER_CONFIG
     )
 
-    return f"https://{Config.AWS_BUCKET_NAME}.s3.{Config.AWS_REGION}.amazonaws.com/{key}"
+    return public_url(key)
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event as sa_event
+
+# app.py crea una app al importarse: necesita DATABASE_URL antes del import
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'import.db')}"
+)
+
+from app import create_app
+from config import Config
+from database import db
+
+
+@pytest.fixture
+def config_overrides():
+    return {}
+
+
+@pytest.fixture
+def app(tmp_path, config_overrides):
+    class TestConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        CACHE_TYPE = "NullCache"
+
+    for key, value in config_overrides.items():
+        setattr(TestConfig, key, value)
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_event(client):
+    """Crea eventos vía la API y devuelve su JSON."""
+
+    def make(title="Evento"):
+        response = client.post("/events", json={"title": title})
+        assert response.status_code == 201
+        return response.get_json()
+
+    return make
+
+
+@pytest.fixture
+def event(make_event):
+    return make_event()
+
+
+@pytest.fixture
+def count_queries(app):
+    """Cuenta las sentencias SQL ejecutadas dentro del bloque."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        sa_event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            sa_event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -0,0 +1,69 @@
+import pytest
+
+
+@pytest.mark.parametrize("classification", [None, "Oro", ["VIP"], {"VIP": 1}])
+def test_add_attendee_rejects_bad_classification(client, event, classification):
+    response = client.post(
+        f"/events/{event['id']}/attendees",
+        json={"name": "Ana", "classification": classification}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("payload", [
+    ["a"],
+    [{"classification": "VIP"}],
+    [{"name": "", "classification": "VIP"}],
+    [{"name": "Ana", "classification": ["VIP"]}],
+])
+def test_bulk_rejects_bad_items(client, event, payload):
+    response = client.post(f"/events/{event['id']}/attendees/bulk", json=payload)
+    assert response.status_code == 400
+
+
+def test_bulk_rejects_oversized_payload(client, event):
+    from attendees import MAX_BULK_SIZE
+
+    payload = [{"name": "Ana", "classification": "VIP"}] * (MAX_BULK_SIZE + 1)
+    response = client.post(f"/events/{event['id']}/attendees/bulk", json=payload)
+    assert response.status_code == 400
+
+
+def test_toggle_checkin(client, event):
+    attendee = client.post(
+        f"/events/{event['id']}/attendees",
+        json={"name": "Ana", "classification": "VIP"}
+    ).get_json()
+
+    assert client.patch(f"/attendees/{attendee['id']}/checkin").get_json()["checked_in"] is True
+    assert client.patch(f"/attendees/{attendee['id']}/checkin").get_json()["checked_in"] is False
+    assert client.patch("/attendees/9999/checkin").status_code == 404
+
+
+def test_writes_inside_shared_app_context(app, client, event):
+    # Una lectura previa deja la sesión con una transacción ya iniciada
+    with app.app_context():
+        assert client.get(f"/events/{event['id']}/attendees").status_code == 200
+        response = client.post(
+            f"/events/{event['id']}/attendees",
+            json={"name": "Ana", "classification": "VIP"}
+        )
+        assert response.status_code == 201
+        assert client.patch(f"/attendees/{response.get_json()['id']}/checkin").status_code == 200
+
+
+def test_toggle_checkin_from_null(app, client, event):
+    from sqlalchemy import update
+
+    from database import db
+    from models import Attendee
+
+    attendee = client.post(
+        f"/events/{event['id']}/attendees",
+        json={"name": "Ana", "classification": "VIP"}
+    ).get_json()
+    with app.app_context():
+        db.session.execute(update(Attendee).values(checked_in=None))
+        db.session.commit()
+
+    assert client.patch(f"/attendees/{attendee['id']}/checkin").get_json()["checked_in"] is True
@@ -0,0 +1,39 @@
+import pytest
+
+
+@pytest.fixture
+def config_overrides():
+    return {"CACHE_TYPE": "SimpleCache"}
+
+
+def test_get_event_etag_returns_304(client, event):
+
+    first = client.get(f"/events/{event['id']}")
+    assert first.status_code == 200
+    assert first.headers["ETag"]
+
+    second = client.get(f"/events/{event['id']}", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+
+
+def test_get_event_cache_hit_skips_db(client, event, count_queries):
+    client.get(f"/events/{event['id']}")
+
+    with count_queries() as statements:
+        response = client.get(f"/events/{event['id']}")
+
+    assert response.status_code == 200
+    assert statements == []
+
+
+def test_writes_invalidate_cached_event(client, event):
+    assert client.get(f"/events/{event['id']}").get_json()["attendees_count"] == 0
+
+    client.post(
+        f"/events/{event['id']}/attendees",
+        json={"name": "Ana", "classification": "VIP"}
+    )
+    assert client.get(f"/events/{event['id']}").get_json()["attendees_count"] == 1
+
+    client.delete(f"/events/{event['id']}")
+    assert client.get(f"/events/{event['id']}").status_code == 404
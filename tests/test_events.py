@@ -0,0 +1,79 @@
+import pytest
+
+from config import Config
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    monkeypatch.setattr(Config, "AWS_ACCESS_KEY", "test")
+    monkeypatch.setattr(Config, "AWS_SECRET_KEY", "test")
+    monkeypatch.setattr(Config, "AWS_BUCKET_NAME", "asistio-test")
+    monkeypatch.setattr(Config, "AWS_REGION", "us-east-1")
+
+
+def test_image_upload_url_returns_presigned_post(client, bucket):
+    response = client.post("/events/image-upload-url", json={"content_type": "image/png"})
+
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data["fields"]["Content-Type"] == "image/png"
+    assert data["fields"]["key"].startswith("events/")
+    assert data["fields"]["key"].endswith(".png")
+    assert data["image_url"].endswith(data["fields"]["key"])
+
+
+@pytest.mark.parametrize("body, status", [
+    ({}, 400),
+    ({"content_type": ["image/png"]}, 400),
+    ({"content_type": "application/x-php"}, 415),
+])
+def test_image_upload_url_rejects_bad_content_type(client, bucket, body, status):
+    response = client.post("/events/image-upload-url", json=body)
+    assert response.status_code == status
+
+
+def test_create_event_with_uploaded_image_url(client, bucket):
+    upload = client.post("/events/image-upload-url", json={"content_type": "image/jpeg"})
+    image_url = upload.get_json()["image_url"]
+
+    response = client.post("/events", json={"title": "Evento", "image_url": image_url})
+
+    assert response.status_code == 201
+    assert response.get_json()["image_url"] == image_url
+
+
+@pytest.mark.parametrize("body", [
+    {"title": ["x"]},
+    {"title": "x", "description": 1},
+    {"title": "x", "image_url": 123},
+    {"title": "x", "image_url": "https://example.com/a.png"},
+])
+def test_create_event_rejects_bad_fields(client, bucket, body):
+    response = client.post("/events", json=body)
+    assert response.status_code == 400
+
+
+def test_create_event_multipart_image_ignores_mime_parameters(client, bucket, monkeypatch):
+    import io
+
+    import s3_utils
+
+    uploads = []
+
+    class FakeS3:
+        def upload_fileobj(self, file, bucket_name, key, ExtraArgs, Config):
+            uploads.append((key, ExtraArgs))
+
+    monkeypatch.setattr(s3_utils, "get_s3_client", lambda: FakeS3())
+
+    response = client.post(
+        "/events",
+        data={"title": "Evento", "image": (io.BytesIO(b"png"), "foto.php", "image/png; foo=bar")},
+        content_type="multipart/form-data"
+    )
+
+    assert response.status_code == 201
+    key, extra_args = uploads[0]
+    assert key.endswith(".png")
+    assert extra_args == {"ContentType": "image/png"}
+    assert response.get_json()["image_url"].endswith(key)
@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.parametrize("url", ["/events", "/events/image-upload-url"])
+@pytest.mark.parametrize("body", [["a"], "texto", 1])
+def test_event_routes_require_json_object(client, url, body):
+    assert client.post(url, json=body).status_code == 400
+
+
+@pytest.mark.parametrize("body", [["a"], {"classification": "VIP"}, {"name": 1, "classification": "VIP"}])
+def test_add_attendee_requires_object_with_name(client, event, body):
+    response = client.post(f"/events/{event['id']}/attendees", json=body)
+    assert response.status_code == 400
+
+
+def test_add_attendee_rejects_malformed_json(client, event):
+    response = client.post(
+        f"/events/{event['id']}/attendees",
+        data="{no es json",
+        content_type="application/json"
+    )
+    assert response.status_code == 400
@@ -0,0 +1,85 @@
+import pytest
+
+
+def test_list_events_keyset_pages(client, make_event):
+    for i in range(5):
+        make_event(f"Evento {i}")
+
+    first = client.get("/events?limit=2").get_json()
+    assert [e["title"] for e in first] == ["Evento 4", "Evento 3"]
+
+    last = first[-1]
+    second = client.get(
+        "/events", query_string={"limit": 2, "before": last["created_at"], "before_id": last["id"]}
+    ).get_json()
+    assert [e["title"] for e in second] == ["Evento 2", "Evento 1"]
+
+
+def test_list_attendees_keyset_pages(client, event):
+    client.post(
+        f"/events/{event['id']}/attendees/bulk",
+        json=[{"name": f"Asistente {i}", "classification": "General"} for i in range(3)]
+    )
+
+    first = client.get(f"/events/{event['id']}/attendees?limit=2").get_json()
+    assert [a["name"] for a in first] == ["Asistente 0", "Asistente 1"]
+
+    last = first[-1]
+    second = client.get(
+        f"/events/{event['id']}/attendees",
+        query_string={"after": last["created_at"], "after_id": last["id"]}
+    ).get_json()
+    assert [a["name"] for a in second] == ["Asistente 2"]
+
+
+def test_list_attendees_without_limit_returns_everything(client, event):
+    client.post(
+        f"/events/{event['id']}/attendees/bulk",
+        json=[{"name": f"Asistente {i}", "classification": "General"} for i in range(150)]
+    )
+
+    response = client.get(f"/events/{event['id']}/attendees")
+
+    assert len(response.get_json()) == 150
+    assert "Link" not in response.headers
+
+
+def test_list_attendees_follow_next_link(client, event):
+    client.post(
+        f"/events/{event['id']}/attendees/bulk",
+        json=[{"name": f"Asistente {i}", "classification": "General"} for i in range(150)]
+    )
+
+    names = []
+    url = f"/events/{event['id']}/attendees?limit=40"
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        names += [a["name"] for a in response.get_json()]
+        link = response.headers.get("Link")
+        url = link[1:link.index(">")] if link else None
+
+    assert names == [f"Asistente {i}" for i in range(150)]
+
+
+def test_list_events_follow_next_link(client, make_event):
+    for i in range(5):
+        make_event(f"Evento {i}")
+
+    first = client.get("/events?limit=3")
+    link = first.headers["Link"]
+    assert link.endswith('; rel="next"')
+
+    second = client.get(link[1:link.index(">")])
+    assert [e["title"] for e in second.get_json()] == ["Evento 1", "Evento 0"]
+    assert "Link" not in second.headers
+
+
+@pytest.mark.parametrize("query", [
+    "limit=abc",
+    "limit=0",
+    "before=2024-01-01T00:00:00Z",
+    "before=ayer&before_id=1",
+])
+def test_list_events_rejects_bad_pagination(client, query):
+    assert client.get(f"/events?{query}").status_code == 400
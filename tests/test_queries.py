@@ -0,0 +1,49 @@
+def test_list_events_single_query(client, make_event, count_queries):
+    for i in range(3):
+        event = make_event(f"Evento {i}")
+        client.post(
+            f"/events/{event['id']}/attendees/bulk",
+            json=[{"name": "Ana", "classification": "VIP"}] * (i + 1)
+        )
+
+    with count_queries() as statements:
+        response = client.get("/events")
+
+    assert response.status_code == 200
+    assert [e["attendees_count"] for e in response.get_json()] == [3, 2, 1]
+    assert len(statements) == 1
+
+
+def test_get_event_single_query(client, event, count_queries):
+    client.post(
+        f"/events/{event['id']}/attendees",
+        json={"name": "Ana", "classification": "General"}
+    )
+
+    with count_queries() as statements:
+        response = client.get(f"/events/{event['id']}")
+
+    assert response.status_code == 200
+    assert response.get_json()["attendees_count"] == 1
+    assert len(statements) == 1
+
+
+def test_bulk_insert_returns_rows_in_input_order(client, event, count_queries):
+    payload = [{"name": f"Asistente {i}", "classification": "General"} for i in range(50)]
+
+    with count_queries() as statements:
+        response = client.post(f"/events/{event['id']}/attendees/bulk", json=payload)
+
+    assert response.status_code == 201
+    attendees = response.get_json()
+    assert [a["name"] for a in attendees] == [p["name"] for p in payload]
+
+    # Cada id devuelto corresponde a la fila de entrada en su misma posición
+    stored = client.get(f"/events/{event['id']}/attendees").get_json()
+    assert len({a["id"] for a in attendees}) == len(payload)
+    assert {a["id"]: a["name"] for a in stored} == {a["id"]: a["name"] for a in attendees}
+
+    # Solo el SELECT 1 del evento además de los INSERT: sin recargas por fila.
+    # SQLite no tiene "sentinel" y emite un INSERT por fila; Postgres, uno solo.
+    others = [s for s in statements if not s.lstrip().upper().startswith("INSERT")]
+    assert len(others) == 1